@@ -59,7 +59,7 @@ def demo_live_integration():
             )
 
             print("   • Fetching detailed work item information...")
-            print("     GET /workitems?ids={ids}&$expand=relations")
+            print("     POST /workitemsbatch (ids in body, $expand=Relations)")
 
             print("   • Retrieving state transition history...")
             print("     GET /workitems/{id}/updates")
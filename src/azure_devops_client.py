@@ -2,13 +2,16 @@ import base64
 import json
 import logging
 import signal
+import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import (
     ADOFlowException,
@@ -23,26 +26,63 @@ from .exceptions import (
 logger = logging.getLogger(__name__)
 
 
+# WIQL for the work item ID query; formatted once per fetch with the validated
+# project name and cutoff date
+_WORK_ITEM_IDS_WIQL = (
+    "SELECT [System.Id] FROM WorkItems "
+    "WHERE [System.TeamProject] = '{project}' "
+    "AND [System.ChangedDate] >= '{cutoff_date}' "
+    "ORDER BY [System.ChangedDate] DESC"
+)
+
+
+@lru_cache(maxsize=4096)
+def _split_tags(tags_value: str) -> tuple:
+    """Split a System.Tags value once per distinct string.
+
+    Tag combinations repeat heavily across work items, so the split result is
+    cached as an immutable tuple of interned tags.
+    """
+    return tuple(sys.intern(tag) for tag in tags_value.split(";"))
+
+
 class AzureDevOpsClient:
     def __init__(self, org_url: str, project: str, pat_token: str):
         self.org_url = org_url.rstrip("/")
         self.project = project
         self.pat_token = pat_token
+        # URL prefixes shared by every request, built once per client
+        self._project_api_url = f"{self.org_url}/_apis/projects/{project}"
+        self._wit_api_url = f"{self.org_url}/{project}/_apis/wit"
         self.headers = {
             "Authorization": f'Basic {base64.b64encode(f":{pat_token}".encode()).decode()}',
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        # Reuse pooled keep-alive connections across the WIQL, batch and state
+        # history requests; the pool covers the 5 concurrent fetch workers
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and release its connections."""
+        self._session.close()
+
+    def __enter__(self) -> "AzureDevOpsClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def verify_connection(self) -> bool:
         """Verify connection to Azure DevOps and permissions"""
         try:
             # Test basic project access
-            project_url = (
-                f"{self.org_url}/_apis/projects/{self.project}?api-version=7.0"
-            )
+            project_url = f"{self._project_api_url}?api-version=7.0"
             logger.info(f"Testing connection to: {project_url}")
-            response = requests.get(project_url, headers=self.headers, timeout=30)
+            response = self._session.get(project_url, headers=self.headers, timeout=30)
 
             if response.status_code == 401:
                 logger.error("Authentication failed - check your PAT token")
@@ -149,13 +189,9 @@ class AzureDevOpsClient:
         # Build WIQL query with validated inputs and project scope
         cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
         wiql_query = {
-            "query": f"""
-            SELECT [System.Id]
-            FROM WorkItems
-            WHERE [System.TeamProject] = '{self.project}'
-            AND [System.ChangedDate] >= '{cutoff_date}'
-            ORDER BY [System.ChangedDate] DESC
-            """
+            "query": _WORK_ITEM_IDS_WIQL.format(
+                project=self.project, cutoff_date=cutoff_date
+            )
         }
 
         response = self._execute_wiql_query(wiql_query)
@@ -172,10 +208,10 @@ class AzureDevOpsClient:
 
     def _execute_wiql_query(self, wiql_query: Dict) -> requests.Response:
         """Execute WIQL query with proper error handling."""
-        wiql_url = f"{self.org_url}/{self.project}/_apis/wit/wiql?api-version=7.0"
+        wiql_url = f"{self._wit_api_url}/wiql?api-version=7.0"
         logger.debug(f"Making WIQL request to: {wiql_url}")
         
-        response = requests.post(
+        response = self._session.post(
             wiql_url, json=wiql_query, headers=self.headers, timeout=30
         )
 
@@ -272,35 +308,50 @@ class AzureDevOpsClient:
     def _transform_work_items(self, work_items: List[Dict]) -> List[Dict]:
         """Transform raw work items to our standardized format."""
         work_items_to_process = []
-        
+
+        # Generate proper web links for Azure DevOps
+        # Convert from: https://dev.azure.com/ORG/PROJECT_GUID/_apis/wit/workItems/ID
+        # To: https://ORG.visualstudio.com/PROJECT/_workitems/edit/ID
+        # The prefix only depends on client configuration, so build it once per call
+        web_link_base = None
+        if self.org_url and self.project:
+            # Extract org name from the org URL
+            org_name = self.org_url.replace("https://dev.azure.com/", "").replace("https://", "").replace(".visualstudio.com", "").rstrip("/")
+            # Use the actual project name from configuration
+            web_link_base = f"https://{org_name}.visualstudio.com/{self.project}/_workitems/edit/"
+
+        # Bind per-item helpers to locals once, outside the hot loop
+        intern = sys.intern
+        extract_display_name = self._extract_display_name
+        parse_tags = self._parse_tags
+        append = work_items_to_process.append
+
         for item in work_items:
             fields = item.get("fields", {})
+            get_field = fields.get
+            web_link = (
+                f"{web_link_base}{item['id']}"
+                if web_link_base and item["id"]
+                else None
+            )
 
-            # Generate proper web link for Azure DevOps
-            # Convert from: https://dev.azure.com/ORG/PROJECT_GUID/_apis/wit/workItems/ID
-            # To: https://ORG.visualstudio.com/PROJECT/_workitems/edit/ID
-            web_link = None
-            if self.org_url and self.project and item["id"]:
-                # Extract org name from the org URL
-                org_name = self.org_url.replace("https://dev.azure.com/", "").replace("https://", "").replace(".visualstudio.com", "").rstrip("/")
-                # Use the actual project name from configuration
-                web_link = f"https://{org_name}.visualstudio.com/{self.project}/_workitems/edit/{item['id']}"
-            
             # Build transformed item without state history (will be fetched concurrently)
             transformed_item = {
                 "id": item["id"],  # Use real Azure DevOps numeric ID directly
                 "raw_id": item["id"],  # Keep raw ID for state history fetching
-                "title": fields.get("System.Title") or "[No Title]",
-                "type": fields.get("System.WorkItemType") or "Unknown",
-                "priority": fields.get("Microsoft.VSTS.Common.Priority") or "Medium",
-                "created_date": fields.get("System.CreatedDate") or "",
-                "created_by": self._extract_display_name(fields.get("System.CreatedBy")) or "Unknown",
-                "assigned_to": self._extract_display_name(fields.get("System.AssignedTo")) or "Unassigned",
-                "current_state": fields.get("System.State") or "New",
+                "title": get_field("System.Title") or "[No Title]",
+                # Types and states repeat across every item, so intern them
+                # to share one string object per distinct value
+                "type": intern(get_field("System.WorkItemType") or "Unknown"),
+                "priority": get_field("Microsoft.VSTS.Common.Priority") or "Medium",
+                "created_date": get_field("System.CreatedDate") or "",
+                "created_by": extract_display_name(get_field("System.CreatedBy")) or "Unknown",
+                "assigned_to": extract_display_name(get_field("System.AssignedTo")) or "Unassigned",
+                "current_state": intern(get_field("System.State") or "New"),
                 "state_transitions": [],  # Will be populated concurrently
-                "story_points": fields.get("Microsoft.VSTS.Scheduling.StoryPoints"),
-                "effort_hours": fields.get("Microsoft.VSTS.Scheduling.OriginalEstimate"),
-                "tags": self._parse_tags(fields.get("System.Tags")),
+                "story_points": get_field("Microsoft.VSTS.Scheduling.StoryPoints"),
+                "effort_hours": get_field("Microsoft.VSTS.Scheduling.OriginalEstimate"),
+                "tags": parse_tags(get_field("System.Tags")),
                 # Preserve Azure DevOps API fields
                 "url": item.get("url"),  # Direct API endpoint
                 "_links": item.get("_links", {}),  # Navigation links
@@ -315,7 +366,7 @@ class AzureDevOpsClient:
                 )
                 continue
 
-            work_items_to_process.append(transformed_item)
+            append(transformed_item)
             
         return work_items_to_process
 
@@ -329,7 +380,8 @@ class AzureDevOpsClient:
         """Parse tags from Azure DevOps tags field."""
         if not tags_value:
             return []
-        return tags_value.split(";")
+        # Copy so callers never mutate the cached tuple's contents
+        return list(_split_tags(tags_value))
 
     def _enrich_with_state_history(
         self, 
@@ -417,15 +469,17 @@ class AzureDevOpsClient:
 
             for attempt in range(max_retries):
                 try:
-                    ids_string = ",".join(map(str, batch_ids))
-                    details_url = f"{self.org_url}/{self.project}/_apis/wit/workitems?ids={ids_string}&$expand=relations&api-version=7.0"
+                    details_url = f"{self._wit_api_url}/workitemsbatch?api-version=7.0"
+                    # workitemsbatch takes the ids in the body, so large
+                    # batches never run into URL length limits
+                    batch_body = {"ids": batch_ids, "$expand": "Relations"}
 
                     logger.debug(
                         f"Fetching batch {batch_num + 1}/{total_batches} (attempt {attempt + 1})"
                     )
 
-                    response = requests.get(
-                        details_url, headers=self.headers, timeout=60
+                    response = self._session.post(
+                        details_url, json=batch_body, headers=self.headers, timeout=60
                     )
 
                     if response.status_code == 429:  # Rate limited
@@ -515,8 +569,8 @@ class AzureDevOpsClient:
         try:
             # Add limit parameter for performance optimization during testing
             limit_param = f"&$top={limit}" if limit else ""
-            updates_url = f"{self.org_url}/{self.project}/_apis/wit/workitems/{work_item_id}/updates?api-version=7.0{limit_param}"
-            response = requests.get(updates_url, headers=self.headers, timeout=30)
+            updates_url = f"{self._wit_api_url}/workitems/{work_item_id}/updates?api-version=7.0{limit_param}"
+            response = self._session.get(updates_url, headers=self.headers, timeout=30)
 
             if response.status_code == 405:
                 logger.warning(
@@ -561,10 +615,8 @@ class AzureDevOpsClient:
     def get_team_members(self) -> List[str]:
         """Get team members from Azure DevOps"""
         try:
-            teams_url = (
-                f"{self.org_url}/_apis/projects/{self.project}/teams?api-version=6.0"
-            )
-            response = requests.get(teams_url, headers=self.headers, timeout=30)
+            teams_url = f"{self._project_api_url}/teams?api-version=6.0"
+            response = self._session.get(teams_url, headers=self.headers, timeout=30)
 
             if response.status_code != 200:
                 return []
@@ -575,9 +627,9 @@ class AzureDevOpsClient:
 
             # Get members of the first team (or you can specify a specific team)
             team_id = teams[0]["id"]
-            members_url = f"{self.org_url}/_apis/projects/{self.project}/teams/{team_id}/members?api-version=6.0"
+            members_url = f"{self._project_api_url}/teams/{team_id}/members?api-version=6.0"
 
-            members_response = requests.get(
+            members_response = self._session.get(
                 members_url, headers=self.headers, timeout=30
             )
 
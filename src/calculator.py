@@ -1,6 +1,6 @@
 import json
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Any
 
@@ -359,12 +359,8 @@ class FlowMetricsCalculator:
             if item["current_state"] in self.active_states
         ]
 
-        wip_by_state = defaultdict(int)
-        wip_by_assignee = defaultdict(int)
-
-        for item in wip_items:
-            wip_by_state[item["current_state"]] += 1
-            wip_by_assignee[item["assigned_to"]] += 1
+        wip_by_state = Counter(item["current_state"] for item in wip_items)
+        wip_by_assignee = Counter(item["assigned_to"] for item in wip_items)
 
         return {
             "total_wip": len(wip_items),
@@ -7,6 +7,7 @@ external configuration, enabling flexible adaptation to different team processes
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -58,6 +59,21 @@ class StateMapper:
                     "isCompletedState": category_config.get("isCompletedState", False),
                     "isFinalState": category_config.get("isFinalState", False)
                 }
+        
+        # Index allowed transitions as (from, to) pairs for O(1) validation
+        allowed_transitions = self.config.get("stateValidation", {}).get("allowedTransitions", {})
+        self.allowed_transition_pairs = frozenset(
+            (from_state, to_state)
+            for from_state, next_states in allowed_transitions.items()
+            for to_state in next_states
+        )
+        
+        # Normalized state groups as frozensets for O(1) membership checks
+        normalized = self.config.get("stateMappings", {}).get("normalized", {})
+        self.normalized_state_sets = {
+            mapping_name: frozenset(states)
+            for mapping_name, states in normalized.items()
+        }
     
     def get_state_category(self, state: str) -> Optional[str]:
         """
@@ -154,23 +170,19 @@ class StateMapper:
     
     def is_todo_state(self, state: str) -> bool:
         """Check if state is a TODO/initial state."""
-        todo_states = self.get_states_by_mapping("normalized", "todo_states")
-        return state in todo_states
+        return state in self.normalized_state_sets.get("todo_states", frozenset())
     
     def is_in_progress_state(self, state: str) -> bool:
         """Check if state is an in-progress state."""
-        progress_states = self.get_states_by_mapping("normalized", "in_progress_states")
-        return state in progress_states
+        return state in self.normalized_state_sets.get("in_progress_states", frozenset())
     
     def is_done_state(self, state: str) -> bool:
         """Check if state is a done state."""
-        done_states = self.get_states_by_mapping("normalized", "done_states")
-        return state in done_states
+        return state in self.normalized_state_sets.get("done_states", frozenset())
     
     def is_cancelled_state(self, state: str) -> bool:
         """Check if state is a cancelled state."""
-        cancelled_states = self.get_states_by_mapping("normalized", "cancelled_states")
-        return state in cancelled_states
+        return state in self.normalized_state_sets.get("cancelled_states", frozenset())
     
     def get_lead_time_bounds(self) -> Tuple[List[str], List[str]]:
         """Get start and end states for lead time calculation."""
@@ -211,9 +223,7 @@ class StateMapper:
         Returns:
             True if transition is allowed
         """
-        allowed_transitions = self.config.get("stateValidation", {}).get("allowedTransitions", {})
-        allowed_next_states = allowed_transitions.get(from_state, [])
-        return to_state in allowed_next_states
+        return (from_state, to_state) in self.allowed_transition_pairs
     
     def get_state_color(self, state: str) -> str:
         """Get the color code for a state based on its category."""
@@ -241,8 +251,13 @@ class StateMapper:
 
 
 # Convenience functions for direct usage
+@lru_cache()
 def get_default_state_mapper() -> StateMapper:
-    """Get StateMapper instance with default configuration."""
+    """Get StateMapper instance with default configuration.
+    
+    The mapper is built once and shared, so the quick helpers below do not
+    re-read workflow_states.json on every call.
+    """
     return StateMapper()
 
 
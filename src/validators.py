@@ -22,6 +22,9 @@ class InputValidator:
     # Pattern for safe file paths (no path traversal)
     SAFE_PATH_PATTERN = re.compile(r'^[a-zA-Z0-9._/-]+$')
     
+    # Pattern for PAT tokens (Base64-like characters)
+    PAT_TOKEN_PATTERN = re.compile(r'^[a-zA-Z0-9+/=]+$')
+    
     @staticmethod
     def validate_azure_org_url(url: str) -> Tuple[bool, str]:
         """Validate Azure DevOps organization URL."""
@@ -72,7 +75,7 @@ class InputValidator:
             return False, "PAT token is too long (maximum 100 characters)"
         
         # Basic format check (Base64-like characters)
-        if not re.match(r'^[a-zA-Z0-9+/=]+$', token):
+        if not InputValidator.PAT_TOKEN_PATTERN.match(token):
             return False, "PAT token contains invalid characters"
         
         return True, "Valid PAT token format"
@@ -248,18 +251,10 @@ class InputValidator:
 class SecurityValidator:
     """Security-focused validation utilities."""
     
-    @staticmethod
-    def check_for_injection_patterns(value: str) -> List[str]:
-        """Check for common injection attack patterns."""
-        threats = []
-        
-        if not isinstance(value, str):
-            return threats
-        
-        value_lower = value.lower()
-        
-        # SQL injection patterns
-        sql_patterns = [
+    # SQL injection patterns
+    SQL_INJECTION_PATTERNS = tuple(
+        re.compile(pattern)
+        for pattern in (
             r"'\s*or\s*'",
             r"'\s*and\s*'",
             r"union\s+select",
@@ -268,25 +263,39 @@ class SecurityValidator:
             r"drop\s+table",
             r"exec\s*\(",
             r"script\s*>",
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, value_lower):
-                threats.append(f"Potential SQL injection pattern detected: {pattern}")
-        
-        # Command injection patterns
-        cmd_patterns = [
+        )
+    )
+    
+    # Command injection patterns
+    COMMAND_INJECTION_PATTERNS = tuple(
+        re.compile(pattern)
+        for pattern in (
             r";\s*rm\s+",
             r";\s*cat\s+",
             r"\|\s*nc\s+",
             r"&&\s*curl",
             r"`[^`]+`",
             r"\$\([^)]+\)",
-        ]
+        )
+    )
+    
+    @staticmethod
+    def check_for_injection_patterns(value: str) -> List[str]:
+        """Check for common injection attack patterns."""
+        threats = []
+        
+        if not isinstance(value, str):
+            return threats
+        
+        value_lower = value.lower()
+        
+        for pattern in SecurityValidator.SQL_INJECTION_PATTERNS:
+            if pattern.search(value_lower):
+                threats.append(f"Potential SQL injection pattern detected: {pattern.pattern}")
         
-        for pattern in cmd_patterns:
-            if re.search(pattern, value_lower):
-                threats.append(f"Potential command injection pattern detected: {pattern}")
+        for pattern in SecurityValidator.COMMAND_INJECTION_PATTERNS:
+            if pattern.search(value_lower):
+                threats.append(f"Potential command injection pattern detected: {pattern.pattern}")
         
         return threats
     
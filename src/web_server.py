@@ -230,15 +230,14 @@ class FlowMetricsWebServer:
                 if not pat_token:
                     raise ValueError("AZURE_DEVOPS_PAT environment variable not set")
 
-                client = AzureDevOpsClient(
+                with AzureDevOpsClient(
                     settings.azure_devops.org_url,
                     settings.azure_devops.default_project,
                     pat_token,
-                )
-
-                work_items = client.get_work_items(
-                    days_back=settings.flow_metrics.default_days_back
-                )
+                ) as client:
+                    work_items = client.get_work_items(
+                        days_back=settings.flow_metrics.default_days_back
+                    )
 
                 if not work_items:
                     raise ValueError("No work items retrieved from Azure DevOps")
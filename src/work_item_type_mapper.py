@@ -9,11 +9,22 @@ import json
 import os
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
 class TypeMetrics:
     """Metrics configuration for a work item type"""
+    # One instance per configured type; slots drop the per-instance __dict__
+    __slots__ = (
+        "include_in_velocity",
+        "include_in_throughput",
+        "include_in_lead_time",
+        "include_in_cycle_time",
+        "weight_in_planning",
+        "complexity_multiplier",
+    )
+
     include_in_velocity: bool
     include_in_throughput: bool
     include_in_lead_time: bool
@@ -25,6 +36,19 @@ class TypeMetrics:
 @dataclass
 class TypeBehavior:
     """Behavior configuration for a work item type"""
+    __slots__ = (
+        "effort_estimation",
+        "typical_effort_range",
+        "default_effort_hours",
+        "default_story_points",
+        "uses_story_points",
+        "has_sub_tasks",
+        "can_be_parent",
+        "flow_type",
+        "priority_sensitive",
+        "requires_estimation",
+    )
+
     effort_estimation: str
     typical_effort_range: List[int]
     default_effort_hours: Optional[int]
@@ -40,6 +64,17 @@ class TypeBehavior:
 @dataclass
 class WorkItemTypeConfig:
     """Complete configuration for a work item type"""
+    __slots__ = (
+        "name",
+        "category",
+        "category_code",
+        "volume",
+        "behavior",
+        "flow_characteristics",
+        "metrics",
+        "validation",
+    )
+
     name: str
     category: str
     category_code: str
@@ -342,28 +377,34 @@ def create_type_mapper(config_path: Optional[str] = None) -> WorkItemTypeMapper:
     return WorkItemTypeMapper(config_path)
 
 
+@lru_cache(maxsize=8)
+def _shared_type_mapper(config_path: Optional[str] = None) -> WorkItemTypeMapper:
+    """Load each configuration once for the read-only convenience functions"""
+    return WorkItemTypeMapper(config_path)
+
+
 # Convenience functions for common operations
 def get_velocity_types(config_path: Optional[str] = None) -> List[str]:
     """Get types included in velocity calculations"""
-    mapper = create_type_mapper(config_path)
+    mapper = _shared_type_mapper(config_path)
     return mapper.get_velocity_types()
 
 
 def get_throughput_types(config_path: Optional[str] = None) -> List[str]:
     """Get types included in throughput calculations"""
-    mapper = create_type_mapper(config_path)
+    mapper = _shared_type_mapper(config_path)
     return mapper.get_throughput_types()
 
 
 def validate_work_item_type(work_item_type: str, config_path: Optional[str] = None) -> bool:
     """Validate if a work item type is configured"""
-    mapper = create_type_mapper(config_path)
+    mapper = _shared_type_mapper(config_path)
     return work_item_type in mapper.get_all_types()
 
 
 def get_type_category(work_item_type: str, config_path: Optional[str] = None) -> Optional[str]:
     """Get category for a work item type"""
-    mapper = create_type_mapper(config_path)
+    mapper = _shared_type_mapper(config_path)
     return mapper.get_category(work_item_type)
 
 
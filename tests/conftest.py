@@ -280,8 +280,11 @@ def pytest_configure(config):
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers."""
     for item in items:
-        # Mark all tests in test_azure_devops_client as integration tests
-        if "test_azure_devops_client" in item.nodeid:
+        # Mark tests in test_azure_devops_client as integration tests unless
+        # they are explicitly marked as pure unit tests
+        if "test_azure_devops_client" in item.nodeid and not item.get_closest_marker(
+            "unit"
+        ):
             item.add_marker(pytest.mark.integration)
 
         # Mark tests that use network calls as slow
@@ -2,37 +2,112 @@
 Tests for Azure DevOps client functionality.
 """
 
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import Mock
 from src.azure_devops_client import AzureDevOpsClient
 from src.config_manager import FlowMetricsSettings
 
+# Shared, read-only API payloads
+_WI_1 = {
+    "id": 1,
+    "fields": {
+        "System.Title": "Test Work Item 1",
+        "System.WorkItemType": "User Story",
+        "System.State": "Active",
+        "System.AssignedTo": {"displayName": "John Doe"},
+        "System.CreatedDate": "2024-01-01T00:00:00Z",
+        "System.ChangedDate": "2024-01-02T00:00:00Z",
+    },
+}
+_WI_2 = {
+    "id": 2,
+    "fields": {
+        "System.Title": "Test Work Item 2",
+        "System.WorkItemType": "Bug",
+        "System.State": "New",
+        "System.AssignedTo": {"displayName": "Jane Doe"},
+        "System.CreatedDate": "2024-01-03T00:00:00Z",
+        "System.ChangedDate": "2024-01-04T00:00:00Z",
+    },
+}
+_WIQL_2_IDS = {
+    "workItems": [
+        {"id": 1, "url": "https://dev.azure.com/_apis/wit/workItems/1"},
+        {"id": 2, "url": "https://dev.azure.com/_apis/wit/workItems/2"},
+    ]
+}
+_WIQL_EMPTY = {"workItems": []}
+_DETAILS_2 = {"value": [_WI_1, _WI_2]}
+_STATE_HISTORY_1 = {
+    "value": [
+        {
+            "fields": {
+                "System.State": {"newValue": "Active"},
+                "System.ChangedDate": {"newValue": "2024-01-01T00:00:00Z"},
+            }
+        }
+    ]
+}
+_TEAMS = {"value": [{"id": "team1", "name": "Test Team"}]}
+_TEAM_MEMBERS = {
+    "value": [
+        {"identity": {"displayName": "John Doe"}},
+        {"identity": {"displayName": "Jane Doe"}},
+    ]
+}
+
+
+def _canned_response(payload, status_code=200):
+    """Build a fresh response mock that returns ``payload``."""
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.json = Mock(return_value=payload)
+    return response
+
+
+def _work_items_responses():
+    """Build the WIQL and details responses for one two-item fetch."""
+    return [_canned_response(_WIQL_2_IDS), _canned_response(_DETAILS_2)]
+
 
+@pytest.fixture(scope="module")
+def mock_config():
+    """Provide mock configuration, built once per module."""
+    config = Mock(spec=FlowMetricsSettings)
+    azure_devops_mock = Mock()
+    azure_devops_mock.organization = "test-org"
+    azure_devops_mock.project = "test-project"
+    azure_devops_mock.pat_token = "test-token"
+    azure_devops_mock.base_url = "https://dev.azure.com"
+    config.azure_devops = azure_devops_mock
+    return config
+
+
+@pytest.fixture(scope="module")
+def client(mock_config):
+    """Provide one configured client per module.
+
+    The client keeps no per-call state, and HTTP is patched on the Session
+    class, so tests can share a single instance.
+    """
+    client = AzureDevOpsClient(
+        org_url=mock_config.azure_devops.base_url
+        + "/"
+        + mock_config.azure_devops.organization,
+        project=mock_config.azure_devops.project,
+        pat_token=mock_config.azure_devops.pat_token,
+    )
+    yield client
+    client.close()
+
+
+@pytest.mark.unit
 class TestAzureDevOpsClient:
-    """Test Azure DevOps client functionality."""
-
-    @pytest.fixture
-    def mock_config(self):
-        """Provide mock configuration for testing."""
-        config = Mock(spec=FlowMetricsSettings)
-        azure_devops_mock = Mock()
-        azure_devops_mock.organization = "test-org"
-        azure_devops_mock.project = "test-project"
-        azure_devops_mock.pat_token = "test-token"
-        azure_devops_mock.base_url = "https://dev.azure.com"
-        config.azure_devops = azure_devops_mock
-        return config
-
-    @pytest.fixture
-    def client(self, mock_config):
-        """Provide configured client for testing."""
-        return AzureDevOpsClient(
-            org_url=mock_config.azure_devops.base_url
-            + "/"
-            + mock_config.azure_devops.organization,
-            project=mock_config.azure_devops.project,
-            pat_token=mock_config.azure_devops.pat_token,
-        )
+    """Test Azure DevOps client behaviour that needs no HTTP."""
 
     def test_client_initialization(self, mock_config):
         """Test client initialization."""
@@ -47,148 +122,193 @@ class TestAzureDevOpsClient:
         assert client.org_url == "https://dev.azure.com/test-org"
         assert client.project == "test-project"
         assert client.pat_token == "test-token"
-        assert "Authorization" in client.headers
-        assert "Content-Type" in client.headers
+        missing = {"Authorization", "Content-Type"} - client.headers.keys()
+        assert not missing, missing
 
     def test_missing_configuration(self):
         """Test client with missing configuration."""
-        with pytest.raises(AttributeError):
+        with pytest.raises(AttributeError, match="rstrip"):
             AzureDevOpsClient(org_url=None, project=None, pat_token=None)
 
-    @patch("src.azure_devops_client.requests.post")
-    @patch("src.azure_devops_client.requests.get")
-    def test_get_work_items_success(self, mock_get, mock_post, client):
-        """Test successful work items fetch."""
-        # Mock WIQL query response
-        mock_post_response = Mock()
-        mock_post_response.raise_for_status.return_value = None
-        mock_post_response.json.return_value = {
-            "workItems": [
-                {"id": 1, "url": "https://dev.azure.com/_apis/wit/workItems/1"},
-                {"id": 2, "url": "https://dev.azure.com/_apis/wit/workItems/2"},
-            ]
-        }
-        mock_post.return_value = mock_post_response
-
-        # Mock work item details responses
-        mock_get_response = Mock()
-        mock_get_response.raise_for_status.return_value = None
-        mock_get_response.json.return_value = {
-            "value": [
-                {
-                    "id": 1,
-                    "fields": {
-                        "System.Title": "Test Work Item 1",
-                        "System.WorkItemType": "User Story",
-                        "System.State": "Active",
-                        "System.AssignedTo": {"displayName": "John Doe"},
-                        "System.CreatedDate": "2024-01-01T00:00:00Z",
-                        "System.ChangedDate": "2024-01-02T00:00:00Z",
-                    },
-                },
-                {
-                    "id": 2,
-                    "fields": {
-                        "System.Title": "Test Work Item 2",
-                        "System.WorkItemType": "Bug",
-                        "System.State": "New",
-                        "System.AssignedTo": {"displayName": "Jane Doe"},
-                        "System.CreatedDate": "2024-01-03T00:00:00Z",
-                        "System.ChangedDate": "2024-01-04T00:00:00Z",
-                    },
+    def test_context_manager_closes_session(self, monkeypatch):
+        """Test leaving the with block closes the pooled session."""
+        close = Mock()
+        monkeypatch.setattr(requests.Session, "close", close)
+
+        with AzureDevOpsClient(
+            "https://dev.azure.com/test-org", "test-project", "test-token"
+        ) as client:
+            assert isinstance(client, AzureDevOpsClient)
+            close.assert_not_called()
+
+        close.assert_called_once_with()
+
+    def test_transform_work_items_web_links(self, client):
+        """Test web links are built from the configured org and project."""
+        transformed = client._transform_work_items([_WI_1, _WI_2])
+
+        assert [item["link"] for item in transformed] == [
+            "https://test-org.visualstudio.com/test-project/_workitems/edit/1",
+            "https://test-org.visualstudio.com/test-project/_workitems/edit/2",
+        ]
+
+    def test_transform_work_items_interns_categories(self, client):
+        """Test repeated types and states share one string object."""
+        raw_items = [
+            {
+                "id": item_id,
+                "fields": {
+                    # Build fresh strings, as JSON decoding would
+                    "System.WorkItemType": "".join(["User ", "Story"]),
+                    "System.State": "".join(["Act", "ive"]),
+                    "System.CreatedDate": "2024-01-01T00:00:00Z",
                 },
-            ]
-        }
-        mock_get.return_value = mock_get_response
+            }
+            for item_id in (1, 2)
+        ]
 
-        work_items = client.get_work_items()
+        first, second = client._transform_work_items(raw_items)
+
+        assert first["type"] is second["type"]
+        assert first["current_state"] is second["current_state"]
+
+    def test_parse_tags_returns_independent_lists(self, client):
+        """Test cached tag parsing hands out a fresh list per call."""
+        first = client._parse_tags("frontend;critical")
+        second = client._parse_tags("frontend;critical")
+
+        assert first == second == ["frontend", "critical"]
+        first.append("mutated")
+        assert client._parse_tags("frontend;critical") == ["frontend", "critical"]
+        assert client._parse_tags("") == []
+
+
+@pytest.mark.integration
+class TestAzureDevOpsClientHTTP:
+    """Test Azure DevOps client calls against mocked HTTP responses."""
+
+    @pytest.fixture(autouse=True)
+    def http(self, monkeypatch):
+        """Replace the client's HTTP verbs with plain mocks for one test."""
+        http = SimpleNamespace(post=Mock(), get=Mock())
+        monkeypatch.setattr(requests.Session, "post", http.post)
+        monkeypatch.setattr(requests.Session, "get", http.get)
+        return http
+
+    @pytest.mark.parametrize(
+        "kwargs,days_back,limit_param",
+        [
+            ({}, 90, ""),
+            ({"days_back": 30}, 30, ""),
+            ({"history_limit": 5}, 90, "&$top=5"),
+        ],
+        ids=["defaults", "days_back", "history_limit"],
+    )
+    def test_get_work_items_success(self, http, client, kwargs, days_back, limit_param):
+        """Test successful work items fetch for each call variant."""
+        http.post.side_effect = _work_items_responses()
+
+        work_items = client.get_work_items(**kwargs)
+
+        assert [(item["id"], item["title"]) for item in work_items] == [
+            (1, "Test Work Item 1"),
+            (2, "Test Work Item 2"),
+        ]
+        # days_back sets the WIQL cutoff date
+        cutoff = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        query = http.post.call_args_list[0].kwargs["json"]["query"]
+        assert f"[System.ChangedDate] >= '{cutoff}'" in query
+        # history_limit caps each state history request; the first GET is
+        # the project check
+        history_urls = [call.args[0] for call in http.get.call_args_list[1:]]
+        assert len(history_urls) == 2
+        assert all(
+            url.endswith(f"/updates?api-version=7.0{limit_param}")
+            for url in history_urls
+        )
+
+    def test_request_urls(self, http, client):
+        """Test requests target the configured org and project endpoints."""
+        http.post.side_effect = _work_items_responses()
+
+        client.get_work_items()
 
-        assert len(work_items) == 2
-        assert work_items[0]["id"] == "WI-1"  # Client transforms id to WI-{id}
-        assert work_items[0]["title"] == "Test Work Item 1"
-        assert work_items[1]["id"] == "WI-2"
-        assert work_items[1]["title"] == "Test Work Item 2"
+        wit_api = "https://dev.azure.com/test-org/test-project/_apis/wit"
+        assert [call.args[0] for call in http.post.call_args_list] == [
+            f"{wit_api}/wiql?api-version=7.0",
+            f"{wit_api}/workitemsbatch?api-version=7.0",
+        ]
+        assert http.get.call_args_list[0].args[0] == (
+            "https://dev.azure.com/test-org/_apis/projects/test-project?api-version=7.0"
+        )
+
+    def test_progress_callback(self, http, client):
+        """Test progress callbacks are reported in pipeline order."""
+        http.post.side_effect = _work_items_responses()
+        callback = Mock()
+
+        client.get_work_items(progress_callback=callback)
+
+        events = [call.args[0] for call in callback.call_args_list]
+        assert events == ["phase", "phase", "count", "phase", "batch", "phase", "items"]
+        callback.assert_any_call("count", 2)
+        callback.assert_any_call("batch", 1, 1)
 
-    @patch("src.azure_devops_client.requests.post")
-    def test_get_work_items_api_error(self, mock_post, client):
-        """Test work items fetch with API error."""
-        mock_post.side_effect = Exception("API Error")
+    @pytest.mark.parametrize(
+        "error",
+        [
+            Exception("API Error"),
+            requests.exceptions.Timeout("Request timed out"),
+            requests.exceptions.ConnectionError("Connection refused"),
+            requests.exceptions.HTTPError("401 Unauthorized"),
+            requests.exceptions.RequestException("Request failed"),
+        ],
+        ids=["unexpected", "timeout", "connection", "http", "request"],
+    )
+    def test_get_work_items_api_error(self, http, client, error):
+        """Test work items fetch returns nothing on each API error type."""
+        http.post.side_effect = error
 
         work_items = client.get_work_items()
         assert work_items == []
 
-    @patch("src.azure_devops_client.requests.post")
-    def test_get_work_items_empty_result(self, mock_post, client):
+    def test_get_work_items_empty_result(self, http, client):
         """Test work items fetch with empty result."""
-        # Mock empty API response
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"workItems": []}
-        mock_post.return_value = mock_response
+        http.post.return_value = _canned_response(_WIQL_EMPTY)
 
         work_items = client.get_work_items()
         assert work_items == []
 
-    @patch("src.azure_devops_client.requests.get")
-    def test_get_state_history_success(self, mock_get, client):
+    def test_get_state_history_success(self, http, client):
         """Test successful state history fetch."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "value": [
-                {
-                    "fields": {
-                        "System.State": {"newValue": "Active"},
-                        "System.ChangedDate": {"newValue": "2024-01-01T00:00:00Z"},
-                    }
-                }
-            ]
-        }
-        mock_get.return_value = mock_response
+        http.get.return_value = _canned_response(_STATE_HISTORY_1)
 
         history = client._get_state_history(123)
         assert len(history) == 1
         assert history[0]["state"] == "Active"
 
-    @patch("src.azure_devops_client.requests.get")
-    def test_get_state_history_error(self, mock_get, client):
-        """Test state history fetch with error."""
-        mock_get.side_effect = Exception("Network error")
-
-        history = client._get_state_history(123)
-        assert history == []
-
-    @patch("src.azure_devops_client.requests.get")
-    def test_get_team_members_success(self, mock_get, client):
+    def test_get_team_members_success(self, http, client):
         """Test successful team members fetch."""
-        # Mock teams response first
-        mock_teams_response = Mock()
-        mock_teams_response.status_code = 200
-        mock_teams_response.json.return_value = {
-            "value": [{"id": "team1", "name": "Test Team"}]
-        }
-
-        # Mock team members response
-        mock_members_response = Mock()
-        mock_members_response.status_code = 200
-        mock_members_response.json.return_value = {
-            "value": [
-                {"identity": {"displayName": "John Doe"}},
-                {"identity": {"displayName": "Jane Doe"}},
-            ]
-        }
-
-        mock_get.side_effect = [mock_teams_response, mock_members_response]
+        http.get.side_effect = [
+            _canned_response(_TEAMS),
+            _canned_response(_TEAM_MEMBERS),
+        ]
 
         members = client.get_team_members()
         assert len(members) == 2
-        assert "John Doe" in members
-        assert "Jane Doe" in members
+        missing = {"John Doe", "Jane Doe"}.difference(members)
+        assert not missing, missing
 
-    @patch("src.azure_devops_client.requests.get")
-    def test_get_team_members_error(self, mock_get, client):
-        """Test team members fetch with error."""
-        mock_get.side_effect = Exception("Network error")
+    @pytest.mark.parametrize(
+        "fetch",
+        [
+            lambda c: c._get_state_history(123),
+            lambda c: c.get_team_members(),
+        ],
+        ids=["state_history", "team_members"],
+    )
+    def test_get_requests_network_error(self, http, client, fetch):
+        """Test GET-based fetches return nothing on network errors."""
+        http.get.side_effect = Exception("Network error")
 
-        members = client.get_team_members()
-        assert members == []
+        assert fetch(client) == []
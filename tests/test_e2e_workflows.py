@@ -190,8 +190,8 @@ class TestCompleteWorkflows:
             }
         }
 
-    @patch('src.azure_devops_client.requests.get')
-    @patch('src.azure_devops_client.requests.post')
+    @patch('src.azure_devops_client.requests.Session.get')
+    @patch('src.azure_devops_client.requests.Session.post')
     def test_complete_cli_fetch_workflow(self, mock_post, mock_get, e2e_environment, mock_ado_api_full):
         """Test complete CLI workflow: configure → fetch → calculate → display."""
         
@@ -199,12 +199,11 @@ class TestCompleteWorkflows:
         mock_post_response = Mock()
         mock_post_response.raise_for_status.return_value = None
         mock_post_response.json.return_value = mock_ado_api_full["wiql_response"]
-        mock_post.return_value = mock_post_response
         
-        mock_get_response = Mock()
-        mock_get_response.raise_for_status.return_value = None
-        mock_get_response.json.return_value = mock_ado_api_full["work_items_batch"]
-        mock_get.return_value = mock_get_response
+        mock_batch_response = Mock()
+        mock_batch_response.raise_for_status.return_value = None
+        mock_batch_response.json.return_value = mock_ado_api_full["work_items_batch"]
+        mock_post.side_effect = [mock_post_response, mock_batch_response]
         
         config_file = e2e_environment["config_file"]
         
@@ -219,8 +218,8 @@ class TestCompleteWorkflows:
                     # CLI might exit with 0 on success
                     assert e.code == 0 or e.code is None
 
-    @patch('src.azure_devops_client.requests.get')
-    @patch('src.azure_devops_client.requests.post')
+    @patch('src.azure_devops_client.requests.Session.get')
+    @patch('src.azure_devops_client.requests.Session.post')
     def test_complete_dashboard_workflow(self, mock_post, mock_get, e2e_environment, mock_ado_api_full):
         """Test complete dashboard workflow: start server → load data → display dashboard."""
         
@@ -228,12 +227,11 @@ class TestCompleteWorkflows:
         mock_post_response = Mock()
         mock_post_response.raise_for_status.return_value = None
         mock_post_response.json.return_value = mock_ado_api_full["wiql_response"]
-        mock_post.return_value = mock_post_response
         
-        mock_get_response = Mock()
-        mock_get_response.raise_for_status.return_value = None
-        mock_get_response.json.return_value = mock_ado_api_full["work_items_batch"]
-        mock_get.return_value = mock_get_response
+        mock_batch_response = Mock()
+        mock_batch_response.raise_for_status.return_value = None
+        mock_batch_response.json.return_value = mock_ado_api_full["work_items_batch"]
+        mock_post.side_effect = [mock_post_response, mock_batch_response]
         
         # Setup data storage with test data
         from src.config_manager import FlowMetricsSettings
@@ -286,8 +284,8 @@ class TestCompleteWorkflows:
         for table in expected_tables:
             assert table in tables
 
-    @patch('src.azure_devops_client.requests.get')
-    @patch('src.azure_devops_client.requests.post')
+    @patch('src.azure_devops_client.requests.Session.get')
+    @patch('src.azure_devops_client.requests.Session.post')
     def test_data_pipeline_end_to_end(self, mock_post, mock_get, e2e_environment, mock_ado_api_full):
         """Test complete data pipeline: fetch → transform → store → calculate → serve."""
         
@@ -295,12 +293,11 @@ class TestCompleteWorkflows:
         mock_post_response = Mock()
         mock_post_response.raise_for_status.return_value = None
         mock_post_response.json.return_value = mock_ado_api_full["wiql_response"]
-        mock_post.return_value = mock_post_response
         
-        mock_get_response = Mock()
-        mock_get_response.raise_for_status.return_value = None
-        mock_get_response.json.return_value = mock_ado_api_full["work_items_batch"]
-        mock_get.return_value = mock_get_response
+        mock_batch_response = Mock()
+        mock_batch_response.raise_for_status.return_value = None
+        mock_batch_response.json.return_value = mock_ado_api_full["work_items_batch"]
+        mock_post.side_effect = [mock_post_response, mock_batch_response]
         
         config_file = e2e_environment["config_file"]
         db_file = e2e_environment["db_file"]
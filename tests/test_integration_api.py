@@ -27,9 +27,9 @@ from src.models import WorkItem, StateTransition
 class TestAzureDevOpsIntegration:
     """Integration tests for Azure DevOps API integration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def integration_config(self):
-        """Create realistic integration configuration."""
+        """Create realistic integration configuration, written once per class."""
         config_data = {
             "azure_devops": {
                 "organization": "test-integration-org",
@@ -55,9 +55,9 @@ class TestAzureDevOpsIntegration:
         yield config_file
         Path(config_file).unlink(missing_ok=True)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_ado_responses(self):
-        """Create realistic Azure DevOps API response data."""
+        """Create realistic Azure DevOps API response data (read-only)."""
         return {
             "wiql_response": {
                 "workItems": [
@@ -154,66 +154,74 @@ class TestAzureDevOpsIntegration:
             }
         }
 
-    @patch('src.azure_devops_client.requests.post')
-    @patch('src.azure_devops_client.requests.get')
-    def test_full_workflow_integration(self, mock_get, mock_post, integration_config, mock_ado_responses):
+    @pytest.fixture(scope="class")
+    def integration_settings(self, integration_config):
+        """Load the integration configuration once per class."""
+        return FlowMetricsSettings.from_file(Path(integration_config))
+
+    @pytest.fixture
+    def integration_client(self, integration_settings):
+        """Provide a fresh client built from the shared settings."""
+        return AzureDevOpsClient(
+            org_url=f"{integration_settings.azure_devops.base_url}/{integration_settings.azure_devops.organization}",
+            project=integration_settings.azure_devops.project,
+            pat_token=integration_settings.azure_devops.pat_token
+        )
+
+    @patch('src.azure_devops_client.requests.Session.post')
+    @patch('src.azure_devops_client.requests.Session.get')
+    def test_full_workflow_integration(self, mock_get, mock_post, integration_client, mock_ado_responses):
         """Test complete workflow from configuration to data retrieval."""
         # Setup mock responses
         mock_post_response = Mock()
         mock_post_response.raise_for_status.return_value = None
         mock_post_response.json.return_value = mock_ado_responses["wiql_response"]
-        mock_post.return_value = mock_post_response
-        
-        # Setup sequential GET responses for work items batch and state history
-        mock_get_responses = [
-            Mock(),  # Work items batch
-            Mock(),  # State history for 1001
-            Mock(),  # State history for 1002  
-            Mock(),  # State history for 1003
-            Mock(),  # Teams
-            Mock(),  # Team members
-        ]
-        
-        # Configure work items batch response
-        mock_get_responses[0].raise_for_status.return_value = None
-        mock_get_responses[0].json.return_value = mock_ado_responses["work_items_batch_response"]
-        
-        # Configure state history responses
-        mock_get_responses[1].status_code = 200
-        mock_get_responses[1].json.return_value = mock_ado_responses["state_history_1001"]
-        mock_get_responses[2].status_code = 200
-        mock_get_responses[2].json.return_value = {"value": []}  # Empty history for 1002
-        mock_get_responses[3].status_code = 200
-        mock_get_responses[3].json.return_value = {"value": []}  # Empty history for 1003
-        
-        # Configure teams and members responses
-        mock_get_responses[4].status_code = 200
-        mock_get_responses[4].json.return_value = mock_ado_responses["teams_response"]
-        mock_get_responses[5].status_code = 200
-        mock_get_responses[5].json.return_value = mock_ado_responses["team_members_response"]
-        
-        mock_get.side_effect = mock_get_responses
-        
-        # Load configuration
-        settings = FlowMetricsSettings.from_file(Path(integration_config))
-        
-        # Initialize client
-        client = AzureDevOpsClient(
-            org_url=f"{settings.azure_devops.base_url}/{settings.azure_devops.organization}",
-            project=settings.azure_devops.project,
-            pat_token=settings.azure_devops.pat_token
+
+        # Work item details come from a single workitemsbatch POST
+        mock_batch_response = Mock()
+        mock_batch_response.raise_for_status.return_value = None
+        mock_batch_response.json.return_value = mock_ado_responses["work_items_batch_response"]
+        mock_post.side_effect = [mock_post_response, mock_batch_response]
+        
+        # Key GET responses by URL, since state history is fetched concurrently
+        client = integration_client
+        project_api = f"{client.org_url}/_apis/projects/{client.project}"
+        updates_url = (
+            f"{client.org_url}/{client.project}/_apis/wit/workitems/{{}}/updates"
+            "?api-version=7.0"
         )
+        get_payloads = {
+            f"{project_api}?api-version=7.0": {},
+            updates_url.format(1001): mock_ado_responses["state_history_1001"],
+            updates_url.format(1002): {"value": []},  # Empty history for 1002
+            updates_url.format(1003): {"value": []},  # Empty history for 1003
+            f"{project_api}/teams?api-version=6.0": (
+                mock_ado_responses["teams_response"]
+            ),
+            f"{project_api}/teams/team1/members?api-version=6.0": (
+                mock_ado_responses["team_members_response"]
+            ),
+        }
+
+        def get_response(url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.raise_for_status.return_value = None
+            response.json.return_value = get_payloads[url]
+            return response
+
+        mock_get.side_effect = get_response
         
         # Test work items retrieval
         work_items = client.get_work_items()
         
         # Verify integration results
         assert len(work_items) == 3
-        assert work_items[0]["id"] == "WI-1001"
+        assert work_items[0]["id"] == 1001
         assert work_items[0]["title"] == "Implement user authentication"
         assert work_items[0]["type"] == "User Story"
-        assert work_items[0]["state"] == "Done"
-        assert work_items[0]["assignedTo"] == "Alice Johnson"
+        assert work_items[0]["current_state"] == "Done"
+        assert work_items[0]["assigned_to"] == "Alice Johnson"
         
         # Test team members retrieval
         team_members = client.get_team_members()
@@ -222,38 +230,28 @@ class TestAzureDevOpsIntegration:
         assert "Bob Smith" in team_members
         
         # Verify API calls were made correctly
-        assert mock_post.called
-        assert mock_get.call_count >= 2  # At least work items batch + some additional calls
+        assert mock_post.call_count == 2  # WIQL query + one workitemsbatch POST
+        assert mock_get.call_count >= 2  # At least teams + team members
 
-    def test_configuration_validation_integration(self, integration_config):
+    def test_configuration_validation_integration(self, integration_settings, integration_client):
         """Test configuration validation across components."""
         # Test valid configuration
-        settings = FlowMetricsSettings.from_file(Path(integration_config))
+        settings = integration_settings
         assert settings.azure_devops.organization == "test-integration-org"
         assert settings.azure_devops.project == "test-integration-project"
         assert len(settings.stage_definitions.active_states) == 4
         
         # Test configuration with Azure DevOps client
-        client = AzureDevOpsClient(
-            org_url=f"{settings.azure_devops.base_url}/{settings.azure_devops.organization}",
-            project=settings.azure_devops.project,
-            pat_token=settings.azure_devops.pat_token
-        )
+        client = integration_client
         
         assert client.org_url == "https://dev.azure.com/test-integration-org"
         assert client.project == "test-integration-project"
         assert "Authorization" in client.headers
 
-    @patch('src.azure_devops_client.requests.post')
-    def test_error_handling_integration(self, mock_post, integration_config):
+    @patch('src.azure_devops_client.requests.Session.post')
+    def test_error_handling_integration(self, mock_post, integration_client):
         """Test error handling across component integration."""
-        settings = FlowMetricsSettings.from_file(Path(integration_config))
-        
-        client = AzureDevOpsClient(
-            org_url=f"{settings.azure_devops.base_url}/{settings.azure_devops.organization}",
-            project=settings.azure_devops.project,
-            pat_token=settings.azure_devops.pat_token
-        )
+        client = integration_client
         
         # Test network error handling
         mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -265,39 +263,30 @@ class TestAzureDevOpsIntegration:
         work_items = client.get_work_items()
         assert work_items == []
 
-    def test_data_transformation_integration(self, integration_config, mock_ado_responses):
+    def test_data_transformation_integration(self, integration_client, mock_ado_responses):
         """Test data transformation through the integration pipeline."""
-        with patch('src.azure_devops_client.requests.post') as mock_post, \
-             patch('src.azure_devops_client.requests.get') as mock_get:
+        with patch('src.azure_devops_client.requests.Session.post') as mock_post, \
+             patch('src.azure_devops_client.requests.Session.get') as mock_get:
             
             # Setup mocks
             mock_post_response = Mock()
             mock_post_response.raise_for_status.return_value = None
             mock_post_response.json.return_value = mock_ado_responses["wiql_response"]
-            mock_post.return_value = mock_post_response
-            
-            mock_get_response = Mock()
-            mock_get_response.raise_for_status.return_value = None
-            mock_get_response.json.return_value = mock_ado_responses["work_items_batch_response"]
-            mock_get.return_value = mock_get_response
             
-            settings = FlowMetricsSettings.from_file(Path(integration_config))
-            client = AzureDevOpsClient(
-                org_url=f"{settings.azure_devops.base_url}/{settings.azure_devops.organization}",
-                project=settings.azure_devops.project,
-                pat_token=settings.azure_devops.pat_token
-            )
+            mock_batch_response = Mock()
+            mock_batch_response.raise_for_status.return_value = None
+            mock_batch_response.json.return_value = mock_ado_responses["work_items_batch_response"]
+            mock_post.side_effect = [mock_post_response, mock_batch_response]
             
-            work_items = client.get_work_items()
+            work_items = integration_client.get_work_items()
             
             # Verify transformation from ADO format to internal format
-            assert all(item["id"].startswith("WI-") for item in work_items)
+            assert [item["id"] for item in work_items] == [1001, 1002, 1003]
             assert all("title" in item for item in work_items)
             assert all("type" in item for item in work_items)
-            assert all("state" in item for item in work_items)
-            assert all("assignedTo" in item for item in work_items)
-            assert all("createdDate" in item for item in work_items)
-            assert all("changedDate" in item for item in work_items)
+            assert all("current_state" in item for item in work_items)
+            assert all("assigned_to" in item for item in work_items)
+            assert all("created_date" in item for item in work_items)
 
 
 @pytest.mark.integration
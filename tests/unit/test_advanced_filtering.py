@@ -3,6 +3,7 @@ Unit tests for AdvancedFiltering class methods.
 Tests JavaScript functionality through Python mock simulation.
 """
 
+import copy
 import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
@@ -71,80 +72,60 @@ class MockAdvancedFiltering:
         """Apply current filters to work items."""
         if work_items is None:
             work_items = self.work_items_data
-            
-        filtered_items = work_items.copy()
-        
-        # Apply work item type filter
-        if self.filters['workItemTypes']:
-            filtered_items = [
-                item for item in filtered_items 
-                if item.get('workItemType') in self.filters['workItemTypes']
-            ]
-        
-        # Apply priority filter
-        if self.filters['priorities']:
-            filtered_items = [
-                item for item in filtered_items 
-                if item.get('priority') in self.filters['priorities']
-            ]
-        
-        # Apply assignee filter
-        if self.filters['assignees']:
-            filtered_items = [
-                item for item in filtered_items 
-                if item.get('assignedTo') in self.filters['assignees']
-            ]
-        
-        # Apply state filter
-        if self.filters['states']:
-            filtered_items = [
-                item for item in filtered_items 
-                if item.get('state') in self.filters['states']
-            ]
-        
-        # Apply tag filter
-        if self.filters['tags']:
-            filtered_items = [
-                item for item in filtered_items 
-                if any(tag in item.get('tags', []) for tag in self.filters['tags'])
-            ]
-        
-        # Apply date range filter
-        if self.filters['dateRange']['start'] or self.filters['dateRange']['end']:
-            filtered_items = self._apply_date_filter(filtered_items)
-        
-        return filtered_items
-
-    def _apply_date_filter(self, items):
-        """Apply date range filter to items."""
-        start_date = self.filters['dateRange']['start']
-        end_date = self.filters['dateRange']['end']
-        
-        if not start_date and not end_date:
-            return items
-        
-        filtered = []
-        for item in items:
-            item_date = item.get('createdDate') or item.get('updatedDate')
-            if not item_date:
-                continue
-                
-            # Simple date comparison (assuming ISO format)
-            if start_date and item_date < start_date:
-                continue
-            if end_date and item_date > end_date:
-                continue
-                
-            filtered.append(item)
-        
-        return filtered
+        
+        # Nothing to filter on: skip the filtering pass
+        if not self._count_active_filters():
+            return list(work_items)
+        
+        return self._filter_items(work_items)
+
+    def _filter_items(self, work_items):
+        """Filter work items against the current filters in a single pass."""
+        # Bind the filter categories once per call
+        filters = self.filters
+        types = frozenset(filters['workItemTypes'])
+        priorities = frozenset(filters['priorities'])
+        assignees = frozenset(filters['assignees'])
+        states = frozenset(filters['states'])
+        tags = frozenset(filters['tags'])
+        start_date = filters['dateRange']['start']
+        end_date = filters['dateRange']['end']
+        has_date_range = bool(start_date or end_date)
+        
+        def keep(item):
+            if types and item.get('workItemType') not in types:
+                return False
+            if priorities and item.get('priority') not in priorities:
+                return False
+            if assignees and item.get('assignedTo') not in assignees:
+                return False
+            if states and item.get('state') not in states:
+                return False
+            if tags and tags.isdisjoint(item.get('tags', ())):
+                return False
+            if has_date_range:
+                # Simple date comparison (assuming ISO format)
+                item_date = item.get('createdDate') or item.get('updatedDate')
+                if not item_date:
+                    return False
+                if start_date and item_date < start_date:
+                    return False
+                if end_date and item_date > end_date:
+                    return False
+            return True
+        
+        # The comprehension builds a new list, so no up-front copy is needed
+        return [item for item in work_items if keep(item)]
 
     def get_filter_stats(self, work_items=None):
         """Get statistics about current filters."""
         if work_items is None:
             work_items = self.work_items_data
             
-        filtered = self.apply_filters(work_items)
+        if self._count_active_filters():
+            filtered = self._filter_items(work_items)
+        else:
+            filtered = work_items
         
         return {
             'total_items': len(work_items),
@@ -169,14 +150,15 @@ class MockAdvancedFiltering:
     def save_preset(self, name, filters=None):
         """Save current filters as a preset."""
         if filters is None:
-            filters = self.filters.copy()
-        self.presets[name] = filters
+            filters = self.filters
+        # Deep copy so later filter edits cannot reach the saved lists
+        self.presets[name] = copy.deepcopy(filters)
         return True
 
     def load_preset(self, name):
         """Load a saved preset."""
         if name in self.presets:
-            self.filters = self.presets[name].copy()
+            self.filters = copy.deepcopy(self.presets[name])
             return True
         return False
 
@@ -472,6 +454,16 @@ class TestFilteringStatistics:
         assert stats['filter_reduction'] == 0
         assert stats['active_filters'] == 0
 
+    def test_apply_filters_without_filters_returns_new_list(self, filtering, sample_work_items):
+        """Test unfiltered calls return every item in a fresh list."""
+        filtering.set_work_items_data(sample_work_items)
+        
+        filtered = filtering.apply_filters()
+        
+        assert filtered == sample_work_items
+        assert filtered is not sample_work_items
+        assert filtering.get_filter_stats()['filtered_items'] == 4
+
     def test_get_filter_stats_with_filters(self, filtering, sample_work_items):
         """Test filter statistics with active filters."""
         filtering.set_work_items_data(sample_work_items)
@@ -541,6 +533,23 @@ class TestFilteringPresets:
         assert filtering.presets['critical_bugs']['workItemTypes'] == ['Bug']
         assert filtering.presets['critical_bugs']['priorities'] == ['High']
 
+    def test_preset_unaffected_by_later_filter_changes(self, filtering):
+        """Test that editing filters after saving does not alter the preset."""
+        filtering.add_filter('workItemTypes', 'Bug')
+        filtering.save_preset('bugs')
+        
+        filtering.add_filter('workItemTypes', 'Feature')
+        filtering.filters['dateRange']['start'] = '2024-01-01'
+        
+        filtering.load_preset('bugs')
+        assert filtering.filters['workItemTypes'] == ['Bug']
+        assert filtering.filters['dateRange']['start'] is None
+        
+        # Loaded filters are independent of the stored preset too
+        filtering.add_filter('workItemTypes', 'Task')
+        filtering.load_preset('bugs')
+        assert filtering.filters['workItemTypes'] == ['Bug']
+
     def test_load_preset(self, filtering):
         """Test loading filter preset."""
         # Setup preset